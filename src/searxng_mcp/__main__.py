@@ -3,23 +3,30 @@
 import asyncio
 import logging
 
-from .config import Config
+from .config import Config, get_config
 from .server import create_server
 
 
 def main() -> None:
     """Run the SearXNG MCP server."""
     # Load configuration
-    config = Config()
+    config = get_config()
 
     # Configure logging
     logging.basicConfig(
-        level=getattr(logging, config.log_level.upper()),
+        level=logging.getLevelNamesMapping()[config.log_level],
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    # Use uvloop when it is installed, otherwise the default asyncio loop
+    try:
+        import uvloop
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
     # Run the server
-    asyncio.run(run_server(config))
+    asyncio.run(run_server(config), loop_factory=loop_factory)
 
 
 async def run_server(config: Config) -> None:
@@ -1,6 +1,10 @@
 """Configuration management for SearXNG MCP server."""
 
-from pydantic import Field
+import logging
+from functools import lru_cache
+from typing import Any, Literal
+
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -33,9 +37,12 @@ class Config(BaseSettings):
         description="Request timeout in seconds"
     )
 
-    log_level: str = Field(
+    log_level: Literal["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
         default="INFO",
-        description="Logging verbosity level (DEBUG, INFO, WARNING, ERROR, CRITICAL)"
+        description=(
+            "Logging verbosity level (NOTSET, DEBUG, INFO, WARNING, ERROR, "
+            "CRITICAL; case-insensitive, WARN and FATAL accepted as aliases)"
+        )
     )
 
     max_results_limit: int = Field(
@@ -45,6 +52,28 @@ class Config(BaseSettings):
         description="Maximum number of results allowed per query"
     )
 
+    @field_validator("log_level", mode="before")
+    @classmethod
+    def normalize_log_level(cls, value: Any) -> Any:
+        """Accept log level names in any case, including aliases like WARN.
+
+        Aliases known to the logging module are mapped to their canonical
+        name (WARN -> WARNING, FATAL -> CRITICAL).
+        """
+        if not isinstance(value, str):
+            return value
+        name = value.upper()
+        level = logging.getLevelNamesMapping().get(name)
+        return logging.getLevelName(level) if level is not None else name
+
 
-# Global config instance
-config = Config()
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide configuration, loading it on first use.
+
+    Environment variables and the .env file are read only once per process.
+
+    Returns:
+        Cached Config instance
+    """
+    return Config()
@@ -1,35 +1,31 @@
-"""Pydantic models for SearXNG API responses."""
+"""Data models for SearXNG API responses."""
 
+from dataclasses import dataclass, field
 from typing import Optional
 
-from pydantic import BaseModel, Field
 
-
-class SearchResult(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SearchResult:
     """A single search result from SearXNG.
 
     Attributes:
         title: The title of the search result
         url: The URL of the search result
-        content: Description/snippet of the search result
+        content: Description/snippet of the search result, truncated to
+            300 characters (plus "...") by SearXNGClient
         publishedDate: Optional publication date of the result
         engines: List of search engines that returned this result
     """
 
-    title: str = Field(..., description="Title of the search result")
-    url: str = Field(..., description="URL of the search result")
-    content: str = Field(..., description="Description/snippet of the search result")
-    publishedDate: Optional[str] = Field(
-        None,
-        description="Publication date of the result (may be None)"
-    )
-    engines: list[str] = Field(
-        default_factory=list,
-        description="List of search engines that returned this result"
-    )
+    title: str
+    url: str
+    content: str
+    publishedDate: Optional[str] = None
+    engines: list[str] = field(default_factory=list)
 
 
-class SearchResults(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class SearchResults:
     """Collection of search results from SearXNG.
 
     Attributes:
@@ -38,13 +34,6 @@ class SearchResults(BaseModel):
         number_of_results: Total number of results returned
     """
 
-    query: str = Field(..., description="The original search query")
-    results: list[SearchResult] = Field(
-        default_factory=list,
-        description="List of search results"
-    )
-    number_of_results: int = Field(
-        ...,
-        ge=0,
-        description="Total number of results returned"
-    )
+    query: str
+    results: list[SearchResult] = field(default_factory=list)
+    number_of_results: int
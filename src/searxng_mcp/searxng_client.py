@@ -1,9 +1,12 @@
 """HTTP client for SearXNG API interaction."""
 
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Optional
 
 import httpx
+import msgspec
 
 from .config import Config
 from .models import SearchResult, SearchResults
@@ -11,6 +14,33 @@ from .models import SearchResult, SearchResults
 logger = logging.getLogger(__name__)
 
 
+class _RawResult(msgspec.Struct):
+    """Wire format of a single entry in a SearXNG ``results`` array.
+
+    Required fields default to UNSET so incomplete results can be skipped
+    instead of rejecting the whole response.
+    """
+
+    title: str | msgspec.UnsetType = msgspec.UNSET
+    url: str | msgspec.UnsetType = msgspec.UNSET
+    content: str | msgspec.UnsetType = msgspec.UNSET
+    publishedDate: Optional[str] = None
+    engines: list[str] = []
+
+
+class _RawResponse(msgspec.Struct):
+    """Wire format of a SearXNG JSON search response."""
+
+    query: str
+    results: list[_RawResult]
+
+
+_DECODER = msgspec.json.Decoder(_RawResponse)
+
+# Snippets longer than this are truncated once when results are built
+_MAX_CONTENT_LENGTH = 300
+
+
 class SearXNGClientError(Exception):
     """Base exception for SearXNG client errors."""
     pass
@@ -31,6 +61,50 @@ class SearXNGResponseError(SearXNGClientError):
     pass
 
 
+@asynccontextmanager
+async def _translate_httpx_errors(
+    op: str,
+    base_url: str,
+    timeout: int,
+    query: Optional[str] = None,
+) -> AsyncIterator[None]:
+    """Translate httpx exceptions raised in the block into SearXNG errors.
+
+    Args:
+        op: Name of the operation, used in log and error messages
+        base_url: Base URL of the SearXNG instance
+        timeout: Request timeout in seconds
+        query: Optional search query, included in the timeout log message
+
+    Raises:
+        SearXNGTimeoutError: If the request times out
+        SearXNGConnectionError: If unable to connect or on any other HTTP error
+    """
+    try:
+        yield
+    except httpx.TimeoutException as e:
+        logger.error(
+            "SearXNG %s timed out%s: %s",
+            op,
+            f" for query '{query}'" if query is not None else "",
+            e,
+        )
+        raise SearXNGTimeoutError(
+            f"SearXNG {op} timed out after {timeout}s"
+        ) from e
+    except httpx.ConnectError as e:
+        logger.error("Failed to connect to SearXNG at %s: %s", base_url, e)
+        raise SearXNGConnectionError(
+            f"Unable to connect to SearXNG at {base_url}. "
+            "Please ensure SearXNG is running."
+        ) from e
+    except httpx.HTTPError as e:
+        logger.error("HTTP error during %s: %s", op, e)
+        raise SearXNGConnectionError(
+            f"HTTP error during SearXNG {op}: {e}"
+        ) from e
+
+
 class SearXNGClient:
     """Async HTTP client for interacting with SearXNG API.
 
@@ -49,12 +123,26 @@ class SearXNGClient:
         self.base_url = config.searxng_base_url.rstrip("/")
         self.timeout = config.searxng_timeout
         self.max_results_limit = config.max_results_limit
+        # Pre-parse the endpoint once; every request goes to the same URL
+        self._search_url = httpx.URL(f"{self.base_url}/search")
+        self._base_params = {"format": "json"}
         # Add headers that SearXNG might expect
         headers = {
             "User-Agent": "searxng-mcp-server/1.0",
             "Accept": "application/json",
         }
-        self.client = httpx.AsyncClient(timeout=self.timeout, headers=headers)
+        # Every request targets the same host, so keep connections alive and
+        # multiplex over HTTP/2 instead of reconnecting per search
+        self.client = httpx.AsyncClient(
+            timeout=self.timeout,
+            headers=headers,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+        )
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -78,30 +166,22 @@ class SearXNGClient:
             SearXNGConnectionError: If unable to connect to SearXNG
             SearXNGTimeoutError: If request times out
         """
-        try:
-            response = await self.client.get(
-                f"{self.base_url}/search",
-                params={"q": "test", "format": "json"}
-            )
-            response.raise_for_status()
-            logger.debug("SearXNG health check successful")
-            return True
-        except httpx.TimeoutException as e:
-            logger.error(f"SearXNG health check timed out: {e}")
-            raise SearXNGTimeoutError(
-                f"SearXNG health check timed out after {self.timeout}s"
-            ) from e
-        except httpx.ConnectError as e:
-            logger.error(f"Failed to connect to SearXNG at {self.base_url}: {e}")
-            raise SearXNGConnectionError(
-                f"Unable to connect to SearXNG at {self.base_url}. "
-                "Please ensure SearXNG is running."
-            ) from e
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error during health check: {e}")
-            raise SearXNGConnectionError(
-                f"HTTP error while connecting to SearXNG: {e}"
-            ) from e
+        async with _translate_httpx_errors("health check", self.base_url, self.timeout):
+            await self._probe()
+        logger.debug("SearXNG health check successful")
+        return True
+
+    async def _probe(self) -> None:
+        """Send a minimal search request to SearXNG.
+
+        Raises:
+            httpx.HTTPError: If the request fails, without any logging
+        """
+        response = await self.client.get(
+            self._search_url,
+            params={**self._base_params, "q": "test"}
+        )
+        response.raise_for_status()
 
     async def search(
         self,
@@ -110,6 +190,8 @@ class SearXNGClient:
         categories: Optional[list[str]] = None,
         language: Optional[str] = None,
         time_range: Optional[str] = None,
+        *,
+        _validated: bool = False,
     ) -> SearchResults:
         """Perform a search query against SearXNG.
 
@@ -119,6 +201,8 @@ class SearXNGClient:
             categories: List of SearXNG categories to search (e.g., ["general", "news"])
             language: ISO 639-1 language code (e.g., "en", "de")
             time_range: Time range filter (e.g., "day", "week", "month", "year")
+            _validated: Set by callers that already checked max_results
+                against the configured limit, to skip checking it again
 
         Returns:
             SearchResults object containing the search results
@@ -130,16 +214,17 @@ class SearXNGClient:
             SearXNGResponseError: If response is malformed or invalid
         """
         # Validate max_results against configured limit
-        if max_results is not None and max_results > self.max_results_limit:
+        if (
+            not _validated
+            and max_results is not None
+            and max_results > self.max_results_limit
+        ):
             raise ValueError(
                 f"max_results ({max_results}) exceeds the configured limit of {self.max_results_limit}"
             )
 
         # Build query parameters
-        params = {
-            "q": query,
-            "format": "json",
-        }
+        params = {**self._base_params, "q": query}
 
         if categories:
             params["categories"] = ",".join(categories)
@@ -150,82 +235,76 @@ class SearXNGClient:
         if time_range:
             params["time_range"] = time_range
 
-        logger.debug(f"Searching SearXNG with query: {query}, params: {params}")
-
-        try:
-            response = await self.client.get(
-                f"{self.base_url}/search",
+        logger.debug("Searching SearXNG with query: %s, params: %s", query, params)
+
+        async with _translate_httpx_errors(
+            "search", self.base_url, self.timeout, query=query
+        ):
+            # Stream the body into our own buffer so it can be released as
+            # soon as it is decoded, before the result models are built
+            body = bytearray()
+            async with self.client.stream(
+                "GET",
+                self._search_url,
                 params=params
-            )
-            response.raise_for_status()
-        except httpx.TimeoutException as e:
-            logger.error(f"SearXNG search timed out for query '{query}': {e}")
-            raise SearXNGTimeoutError(
-                f"Search request timed out after {self.timeout}s"
-            ) from e
-        except httpx.ConnectError as e:
-            logger.error(f"Failed to connect to SearXNG at {self.base_url}: {e}")
-            raise SearXNGConnectionError(
-                f"Unable to connect to SearXNG at {self.base_url}. "
-                "Please ensure SearXNG is running."
-            ) from e
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error during search: {e}")
-            raise SearXNGConnectionError(
-                f"HTTP error while searching: {e}"
-            ) from e
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
 
-        # Parse JSON response
+        # Decode and validate the response in a single pass
         try:
-            data = response.json()
-        except Exception as e:
-            logger.error(f"Failed to parse SearXNG response as JSON: {e}")
+            raw = _DECODER.decode(body)
+        except msgspec.ValidationError as e:
+            logger.error("SearXNG response failed validation: %s", e)
+            raise SearXNGResponseError(f"Invalid SearXNG response: {e}") from e
+        except msgspec.DecodeError as e:
+            logger.error("Failed to parse SearXNG response as JSON: %s", e)
             raise SearXNGResponseError(
                 "SearXNG returned malformed JSON response"
             ) from e
 
-        # Validate required fields
-        if "query" not in data:
-            logger.error("SearXNG response missing 'query' field")
-            raise SearXNGResponseError("Invalid SearXNG response: missing 'query' field")
-
-        if "results" not in data:
-            logger.error("SearXNG response missing 'results' field")
-            raise SearXNGResponseError("Invalid SearXNG response: missing 'results' field")
-
-        # Parse results
-        try:
-            results = []
-            for result_data in data["results"]:
-                # Skip results missing required fields
-                if not all(k in result_data for k in ["title", "url", "content"]):
-                    logger.warning(f"Skipping result with missing required fields: {result_data}")
-                    continue
-
-                result = SearchResult(
-                    title=result_data["title"],
-                    url=result_data["url"],
-                    content=result_data["content"],
-                    publishedDate=result_data.get("publishedDate"),
-                    engines=result_data.get("engines", [])
-                )
-                results.append(result)
-
-            # Limit results if max_results is specified
-            if max_results is not None and max_results > 0:
-                results = results[:max_results]
-
-            search_results = SearchResults(
-                query=data["query"],
-                results=results,
-                number_of_results=len(results)
+        # The raw bytes are no longer needed once the Structs exist
+        del body
+
+        # Build public models. All fields were type-checked by the decoder, so
+        # nothing below can fail on upstream data.
+        unset = msgspec.UNSET
+        result_cls = SearchResult
+        limit = _MAX_CONTENT_LENGTH
+        raw_results = raw.results
+
+        # Results missing required fields are dropped
+        results = [
+            result_cls(
+                title=r.title,
+                url=r.url,
+                content=(
+                    r.content
+                    if len(r.content) <= limit
+                    else r.content[:limit] + "..."
+                ),
+                publishedDate=r.publishedDate,
+                engines=r.engines,
             )
-
-            logger.info(f"Successfully retrieved {len(results)} results for query '{query}'")
-            return search_results
-
-        except Exception as e:
-            logger.error(f"Failed to parse SearXNG results into models: {e}")
-            raise SearXNGResponseError(
-                f"Failed to parse SearXNG response: {e}"
-            ) from e
+            for r in raw_results
+            if r.title is not unset and r.url is not unset and r.content is not unset
+        ]
+
+        if len(results) < len(raw_results):
+            for r in raw_results:
+                if r.title is unset or r.url is unset or r.content is unset:
+                    logger.warning("Skipping result with missing required fields: %s", r)
+
+        # Limit results if max_results is specified, copying only when needed
+        if max_results is not None and 0 < max_results < len(results):
+            results = results[:max_results]
+
+        search_results = SearchResults(
+            query=raw.query,
+            results=results,
+            number_of_results=len(results)
+        )
+
+        logger.info("Successfully retrieved %s results for query '%s'", len(results), query)
+        return search_results
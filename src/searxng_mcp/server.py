@@ -1,13 +1,15 @@
 """MCP server implementation for SearXNG web search."""
 
+import asyncio
 import logging
 from typing import Any
 
+import httpx
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from .config import Config
+from .config import Config, get_config
 from .searxng_client import (
     SearXNGClient,
     SearXNGClientError,
@@ -18,6 +20,9 @@ from .searxng_client import (
 
 logger = logging.getLogger(__name__)
 
+_TIME_RANGES = ("day", "week", "month", "year")
+_VALID_TIME_RANGES = frozenset(_TIME_RANGES)
+
 
 class SearXNGMCPServer:
     """MCP server for SearXNG web search.
@@ -34,58 +39,70 @@ class SearXNGMCPServer:
         """
         self.config = config
         self.server = Server("searxng-mcp")
-        self.client: SearXNGClient | None = None
+        # Created up front so the first tool call can reuse a warm connection
+        self.client = SearXNGClient(config)
+
+        # The tool list never changes at runtime, so build it once
+        self._tools = self._build_tools()
 
         # Register tool handlers
         self._register_handlers()
 
+    def _build_tools(self) -> list[Tool]:
+        """Build the list of tools exposed by this server.
+
+        Returns:
+            List of Tool descriptors
+        """
+        return [
+            Tool(
+                name="web_search",
+                description=(
+                    "Search the web using SearXNG, a privacy-focused metasearch engine. "
+                    "Returns relevant search results including titles, URLs, and content snippets. "
+                    "Supports filtering by language, categories, and time range."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "The search query to execute",
+                        },
+                        "max_results": {
+                            "type": "integer",
+                            "description": "Maximum number of results to return (default: 10)",
+                            "default": 10,
+                            "minimum": 1,
+                            "maximum": self.config.max_results_limit,
+                        },
+                        "categories": {
+                            "type": "array",
+                            "description": "SearXNG categories to search (e.g., general, news, images, videos, files, science)",
+                            "items": {"type": "string"},
+                        },
+                        "language": {
+                            "type": "string",
+                            "description": "ISO 639-1 language code (e.g., 'en', 'de', 'fr')",
+                        },
+                        "time_range": {
+                            "type": "string",
+                            "description": "Filter results by time range",
+                            "enum": list(_TIME_RANGES),
+                        },
+                    },
+                    "required": ["query"],
+                },
+            )
+        ]
+
     def _register_handlers(self) -> None:
         """Register MCP tool handlers."""
 
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """List available tools."""
-            return [
-                Tool(
-                    name="web_search",
-                    description=(
-                        "Search the web using SearXNG, a privacy-focused metasearch engine. "
-                        "Returns relevant search results including titles, URLs, and content snippets. "
-                        "Supports filtering by language, categories, and time range."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "The search query to execute",
-                            },
-                            "max_results": {
-                                "type": "integer",
-                                "description": "Maximum number of results to return (default: 10)",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": self.config.max_results_limit,
-                            },
-                            "categories": {
-                                "type": "array",
-                                "description": "SearXNG categories to search (e.g., general, news, images, videos, files, science)",
-                                "items": {"type": "string"},
-                            },
-                            "language": {
-                                "type": "string",
-                                "description": "ISO 639-1 language code (e.g., 'en', 'de', 'fr')",
-                            },
-                            "time_range": {
-                                "type": "string",
-                                "description": "Filter results by time range",
-                                "enum": ["day", "week", "month", "year"],
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                )
-            ]
+            return self._tools
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
@@ -109,6 +126,7 @@ class SearXNGMCPServer:
         """
         # Extract and validate arguments
         query = arguments.get("query")
+        query = query.strip() if isinstance(query, str) else None
         if not query:
             raise ValueError("'query' parameter is required")
 
@@ -126,20 +144,37 @@ class SearXNGMCPServer:
                 f"'max_results' exceeds limit of {self.config.max_results_limit}"
             )
 
-        logger.info(f"Processing web search: query='{query}', max_results={max_results}")
+        # A bare string would be joined character by character
+        if categories is not None and (
+            not isinstance(categories, list)
+            or not all(isinstance(c, str) for c in categories)
+        ):
+            raise ValueError("'categories' must be a list of strings")
+
+        if language is not None and not isinstance(language, str):
+            raise ValueError("'language' must be a string")
+
+        # The schema declares the enum, but clients are not required to honour it
+        if time_range is not None and (
+            not isinstance(time_range, str) or time_range not in _VALID_TIME_RANGES
+        ):
+            raise ValueError(
+                f"'time_range' must be one of: {', '.join(_TIME_RANGES)}"
+            )
 
-        # Initialize client if needed
-        if self.client is None:
-            self.client = SearXNGClient(self.config)
+        logger.info("Processing web search: query='%s', max_results=%s", query, max_results)
 
         try:
-            # Perform search
+            # Perform search. max_results is always passed because the client
+            # also uses it to trim results; _validated only skips re-checking
+            # it against the limit.
             results = await self.client.search(
                 query=query,
                 max_results=max_results,
                 categories=categories,
                 language=language,
                 time_range=time_range,
+                _validated=True,
             )
 
             # Format results
@@ -192,50 +227,81 @@ class SearXNGMCPServer:
         if not results.results:
             return f"No results found for query: {results.query}"
 
-        lines = [
-            f"Search results for: {results.query}",
-            f"Found {results.number_of_results} results\n",
-        ]
+        header = (
+            f"Search results for: {results.query}\n"
+            f"Found {results.number_of_results} results"
+        )
+        formatted = (
+            self._format_result(i, result)
+            for i, result in enumerate(results.results, 1)
+        )
 
-        for i, result in enumerate(results.results, 1):
-            lines.append(f"{i}. {result.title}")
-            lines.append(f"   URL: {result.url}")
+        # Blank line between entries, trailing newline after the last one
+        return "\n\n".join([header, *formatted]) + "\n"
 
-            if result.content:
-                # Truncate very long content
-                content = result.content[:300]
-                if len(result.content) > 300:
-                    content += "..."
-                lines.append(f"   {content}")
+    @staticmethod
+    def _format_result(index: int, result: Any) -> str:
+        """Format a single search result as readable text.
 
-            if result.publishedDate:
-                lines.append(f"   Published: {result.publishedDate}")
+        Args:
+            index: 1-based position of the result in the listing
+            result: SearchResult object to format
 
-            if result.engines:
-                lines.append(f"   Sources: {', '.join(result.engines)}")
+        Returns:
+            Formatted string for the result, without a trailing newline
+        """
+        parts = [f"{index}. {result.title}", f"   URL: {result.url}"]
 
-            lines.append("")  # Empty line between results
+        if result.content:
+            parts.append(f"   {result.content}")
 
-        return "\n".join(lines)
+        if result.publishedDate:
+            parts.append(f"   Published: {result.publishedDate}")
+
+        if result.engines:
+            parts.append(f"   Sources: {', '.join(result.engines)}")
+
+        return "\n".join(parts)
 
     async def run(self) -> None:
         """Run the MCP server with stdio transport."""
         try:
             logger.info("Starting SearXNG MCP server")
-            logger.info(f"SearXNG URL: {self.config.searxng_base_url}")
-            logger.info(f"Max results limit: {self.config.max_results_limit}")
+            logger.info("SearXNG URL: %s", self.config.searxng_base_url)
+            logger.info("Max results limit: %s", self.config.max_results_limit)
 
             async with stdio_server() as (read_stream, write_stream):
-                await self.server.run(
-                    read_stream,
-                    write_stream,
-                    self.server.create_initialization_options(),
-                )
+                # Open the keep-alive connection while the client initializes
+                warm_up = asyncio.create_task(self._warm_up())
+                try:
+                    await self.server.run(
+                        read_stream,
+                        write_stream,
+                        self.server.create_initialization_options(),
+                    )
+                finally:
+                    # Make sure the warm-up is done before the client closes
+                    warm_up.cancel()
+                    await asyncio.gather(warm_up, return_exceptions=True)
         finally:
             # Clean up client connection
-            if self.client:
-                await self.client.close()
-                logger.info("Closed SearXNG client connection")
+            await self.client.close()
+            logger.info("Closed SearXNG client connection")
+
+    async def _warm_up(self) -> None:
+        """Establish the SearXNG connection before the first tool call.
+
+        Failures are logged as a single warning, since SearXNG may simply not
+        be up yet; the next tool call reports any persistent error.
+        """
+        try:
+            await self.client._probe()
+        except httpx.HTTPError as e:
+            logger.warning(
+                "SearXNG warm-up request to %s failed: %s",
+                self.config.searxng_base_url,
+                e,
+            )
 
 
 async def create_server(config: Config | None = None) -> SearXNGMCPServer:
@@ -248,6 +314,6 @@ async def create_server(config: Config | None = None) -> SearXNGMCPServer:
         Configured SearXNGMCPServer instance
     """
     if config is None:
-        config = Config()
+        config = get_config()
 
     return SearXNGMCPServer(config)